@@ -50,24 +50,80 @@
 #               ]}
 #           ]}
 #
+import os
+import re
 from pprint import PrettyPrinter
-from pyparsing import Word, alphanums, Forward, ZeroOrMore, \
-    Group, Literal, __diag__, Suppress, Char, \
-    ParseSyntaxException, ParseBaseException, \
+from pyparsing import Regex, Forward, ZeroOrMore, \
+    Group, Keyword, __diag__, Suppress, Char, \
+    ParseBaseException, \
     ParseException, OneOrMore, Optional, Empty, \
-    ungroup
+    ungroup, ParserElement, ParseResults, StringEnd
 
 progress = False
-debug_flag = True
+# set AML_DEBUG=1 to trace parsing and turn on the pyparsing diagnostics
+debug_flag = os.environ.get('AML_DEBUG', '0') != '0'
 
-__diag__.enable("enable_debug_on_named_expressions")
-__diag__.enable("warn_multiple_tokens_in_named_alternation")
-__diag__.enable("warn_ungrouped_named_tokens_in_collection")
-__diag__.enable("warn_name_set_on_empty_Forward")
-__diag__.enable("warn_on_multiple_string_args_to_oneof")
+if debug_flag:
+    __diag__.enable("enable_debug_on_named_expressions")
+    __diag__.enable("warn_multiple_tokens_in_named_alternation")
+    __diag__.enable("warn_ungrouped_named_tokens_in_collection")
+    __diag__.enable("warn_name_set_on_empty_Forward")
+    __diag__.enable("warn_on_multiple_string_args_to_oneof")
 
 pos = -1
 
+_PP = PrettyPrinter(indent=2, width=66, compact=False)
+
+# aml_nesting is a recursive Forward with backtracking alternatives, so
+# packrat memoization pays off here; set AML_PACKRAT=0 to disable it.
+if os.environ.get('AML_PACKRAT', '1') != '0':
+    ParserElement.enablePackrat(cache_size_limit=None)
+
+
+# ParserElement -> ParserElement + StringEnd(), see _anchored()
+_anchored_elements = {}
+
+
+def _anchored(a_parse_element):
+    """
+    Return a_parse_element + StringEnd(), built only once per element,
+    so parsing it does what parseString(parseAll=True) does without
+    constructing a new Empty() + StringEnd() on every call.
+    """
+    anchored = _anchored_elements.get(a_parse_element)
+    if anchored is None:
+        anchored = a_parse_element + StringEnd()
+        _anchored_elements[a_parse_element] = anchored
+    return anchored
+
+
+def _named_results_match(a_result, a_expected):
+    """
+    True if the named results of ParseResults a_result equal the
+    a_expected dict, as result.asDict() == a_expected would say, but
+    walked lazily so no nested dict gets built and the first
+    difference ends the comparison.
+    """
+    return (isinstance(a_expected, dict)
+            and sum(1 for _ in a_result.keys()) == len(a_expected)
+            and all(k in a_result and _item_matches(a_result[k], v)
+                    for k, v in a_expected.items()))
+
+
+def _item_matches(a_item, a_expected):
+    """
+    Compare one results value against a_expected the way asDict()
+    converts it: ParseResults with names as a dict, without names
+    as a list, anything else as-is.
+    """
+    if not isinstance(a_item, ParseResults):
+        return a_item == a_expected
+    if a_item.haskeys():
+        return _named_results_match(a_item, a_expected)
+    return (isinstance(a_expected, list)
+            and len(a_item) == len(a_expected)
+            and all(_item_matches(i, e) for i, e in zip(a_item, a_expected)))
+
 
 def assertParseElement(a_parse_element, a_test_data, a_expected_result,
                        a_assert_flag=True):
@@ -91,43 +147,46 @@ def assertParseElement(a_parse_element, a_test_data, a_expected_result,
     retsts = None
 
     try:
-        a_parse_element = a_parse_element.setDebug(True)
-        result = a_parse_element.parseString(a_test_data, parseAll=True)
-        pp = PrettyPrinter(indent=2, width=66, compact=False)
-        if result.asDict() == {}:
-            print('***BAD***-Python-Dict result:', end='')
-            pp.pprint(result)
-        else:
-            print('Good-Python-Dict result:')
-            pp.pprint(result.asDict())
-        print('expecting: ')
-        pp.pprint(a_expected_result)
-        # Convert ParserElement into Python List[] and compare
-        retsts = (result.asDict() == a_expected_result)
+        if debug_flag:
+            a_parse_element = a_parse_element.setDebug(True)
+        result = _anchored(a_parse_element).parseString(a_test_data)
+        # Compare against the Python List[]/dict form of the ParserElement,
+        # only converting it with asDict() when it needs to be shown
+        retsts = _named_results_match(result, a_expected_result)
+        if debug_flag or not retsts:
+            as_dict = result.asDict()
+            if as_dict == {}:
+                print('***BAD***-Python-Dict result:', end='')
+                _PP.pprint(result)
+            else:
+                print('Good-Python-Dict result:')
+                _PP.pprint(as_dict)
+            print('expecting: ')
+            _PP.pprint(a_expected_result)
     except ParseException as pe:
-        print('ParseException:')
-        print(pe.line)  # affected data content
-        print(' ' * (pe.column - 1) + '^')  # Show where the error occurred
-        print(pe)
-        ParseException.explain(pe)
+        if debug_flag:
+            print('ParseException:')
+            print(pe.line)  # affected data content
+            print(' ' * (pe.column - 1) + '^')  # Show where the error occurred
+            print(pe)
+        if a_assert_flag:
+            # Only an unexpected failure is worth walking the parser stack for
+            print(ParseException.explain(pe))
         retsts = False
     except ParseBaseException as pe:
-        print('ParseBaseException:')
-        print(a_test_data)  # affected data content
-        print(' ' * (pe.column - 1) + '^')  # Show where the error occurred
-        print(pe)
-        retsts = False
-    except ParseSyntaxException as pe:
-        print('ParseSyntaxException:')
-        print(a_test_data)  # affected data content
-        print(' ' * (pe.column - 1) + '^')  # Show where the error occurred
-        print(pe)
+        if debug_flag or a_assert_flag:  # nothing to show for an expected failure
+            print('ParseBaseException:')
+            print(a_test_data)  # affected data content
+            print(' ' * (pe.column - 1) + '^')  # Show where the error occurred
+            print(pe)
         retsts = False
     if retsts == a_assert_flag:
         print('assert(True)')
         return True
     else:
         print('assert(***FALSE***)')
+        if not debug_flag:
+            print('rerun with AML_DEBUG=1 for the parse trace and diagnostics')
         errmsg = 'Error(assert=' + str(False) + '): \"' + a_test_data + '\".'
         raise SyntaxError(errmsg)
 
@@ -154,51 +213,69 @@ def assertParseElementFalse(af_parse_element, af_test_data, af_expected_result):
                        a_assert_flag=False)
 
 
-addr = Word(alphanums + '_-./:').setResultsName('addr').setName('<addr>')
-semicolon, lbrack, rbrack = map(Suppress, ';{}')
+# Only pyparsing's own whitespace (ParserElement.DEFAULT_WHITE_CHARS), not \s
+_WS = r'[ \t\r\n]*'
+_element_re = re.compile(r'(!)?' + _WS + r'([A-Za-z0-9_\-./:]+)' + _WS + ';')
+
+
+def _series_action(tokens):
+    """
+    Split the matched run of '! addr;' text of _series_re into one
+    Group()-like ParseResults per AML element, each with the same
+    tokens and 'not'/'addr' results as Optional('!') + addr + ';' gave.
+    """
+    series = []
+    for not_, addr_ in _element_re.findall(tokens[0]):
+        if not_:
+            element = ParseResults([not_, addr_])
+            element['not'] = not_
+        else:
+            element = ParseResults([addr_])
+        element['addr'] = addr_
+        series.append(element)
+    return series
+
+
+# A whole run of flat (optionally negated) AML elements in one re.match()
+_series_re = Regex(
+    r'(?:!?' + _WS + r'[A-Za-z0-9_\-./:]+' + _WS + ';' + _WS + ')+'
+).setParseAction(_series_action).setName('<addr_series>')
+semicolon = Suppress(';')
+lbrack = Suppress('{')
+rbrack = Suppress('}')
 exclamation = Char('!')
+# Shared 'not' prefix; reuse it rather than wrapping exclamation again
+_OPT_NOT = Optional(exclamation('not'))
 
 aml_nesting = Forward()
 aml_nesting << (
     lbrack
     + (
         ZeroOrMore(
-            Group(
-                (
-                    exclamation('not')
-                    + aml_nesting
-                )
-                | (
-                    exclamation('not')
-                    + addr
-                    + semicolon
-                )
-                | (
-                    aml_nesting
-                )
-                | (
-                    addr
-                    + semicolon
-                )  # never set a ResultsLabel here, you get duplicate but un-nested 'addr'
+            # _series_re rejects a '{' or '! {' start within a single
+            # re.match(), so only nested sets reach the second branch
+            _series_re  # never set a ResultsLabel here, you get duplicate but un-nested 'addr'
+            | Group(
+                _OPT_NOT
+                + aml_nesting
             )  # never set a ResultsLabel here, you get no []
-        )(None)
+        )
     )('aml_nesting')
     + rbrack
     + semicolon
-)(None)  # ResultsLabel here didn't force a list, one before here did.
+)  # ResultsLabel here didn't force a list, one before here did.
 
 clause_stmt_acl_standalone = (
-        Literal('acl').suppress()
-        + Word(alphanums + '_-')('acl_name')
+        Keyword('acl').suppress()
+        + Regex(r'[A-Za-z0-9_\-]+')('acl_name')
         + (
             ZeroOrMore(
                 Group(
-
-                    aml_nesting(None)  # peel away testing label here
+                    aml_nesting  # carries no ResultsLabel of its own
                 )  # ('aml_series3')
             )('aml_series')
-        )(None)
-)(None)
+        )
+)
 
 # Syntax:
 #         acl a { b; };  acl c { d; e; f; }; acl g { ! h; ! { i; }; };
@@ -213,100 +290,125 @@ clause_stmt_acl_series = ZeroOrMore(
 #  Unit tests of ACL statements
 #######################################################
 # Null tests
-assertParseElementFalse(aml_nesting, '', {'aml_nesting': []})  # something to aml_nesting
-assertParseElementFalse(clause_stmt_acl_standalone, ' ', {})  # this always expects an ACL statement
-assertParseElementTrue(clause_stmt_acl_series, ' ', {})  # check for null
+_EXP_NULL_AML_NESTING = {'aml_nesting': []}
+_EXP_EMPTY = {}
+assertParseElementFalse(aml_nesting, '', _EXP_NULL_AML_NESTING)  # something to aml_nesting
+assertParseElementFalse(clause_stmt_acl_standalone, ' ', _EXP_EMPTY)  # this always expects an ACL statement
+assertParseElementTrue(clause_stmt_acl_series, ' ', _EXP_EMPTY)  # check for null
 
 # A simple ACL element
+_EXP_ONLY_ELEMENT = {
+    'aml_nesting': [
+        {'addr': 'only_element'},
+        ]}
 assertParseElementTrue(
     aml_nesting,
     '{ only_element; };',
-    {
-        'aml_nesting': [
-            {'addr': 'only_element'},
-            ]})
+    _EXP_ONLY_ELEMENT)
 # A simple not ACL element
+_EXP_NOT_ONLY_ELEMENT = {
+    'aml_nesting': [
+        {'addr': 'only_element', 'not': '!'},
+        ]}
 assertParseElementTrue(
     aml_nesting,
     '{ ! only_element; };',
-    {
-        'aml_nesting': [
-            {'addr': 'only_element', 'not': '!'},
-            ]})
+    _EXP_NOT_ONLY_ELEMENT)
 # A simple series of three ACL elements
+_EXP_THREE_ELEMENTS = {
+    'aml_nesting': [
+        {'addr': 'element1'},
+        {'addr': 'element2'},
+        {'addr': 'element3'},
+        ]}
 assertParseElementTrue(
     aml_nesting,
     '{ element1; element2; element3; };',
-    {
-        'aml_nesting': [
-            {'addr': 'element1'},
-            {'addr': 'element2'},
-            {'addr': 'element3'},
-            ]})
+    _EXP_THREE_ELEMENTS)
+# Vertical tab and form feed are not whitespace to pyparsing
+_EXP_TWO_ELEMENTS = {
+    'aml_nesting': [
+        {'addr': 'a'},
+        {'addr': 'b'},
+        ]}
+assertParseElementFalse(aml_nesting, '{ a;\x0bb; };', _EXP_TWO_ELEMENTS)
+assertParseElementFalse(aml_nesting, '{ a;\x0cb; };', _EXP_TWO_ELEMENTS)
 
 # A simple series of three 'knotted' ACL elements
+_EXP_THREE_NOT_ELEMENTS = {
+    'aml_nesting': [
+        {'addr': 'not_element1', 'not': '!'},
+        {'addr': 'knot_element2', 'not': '!'},
+        {'addr': 'nyot_element3', 'not': '!'},
+        ]}
 assertParseElementTrue(
     aml_nesting,
     '{ ! not_element1; ! knot_element2; ! nyot_element3; };',
-    {
-        'aml_nesting': [
-            {'addr': 'not_element1', 'not': '!'},
-            {'addr': 'knot_element2', 'not': '!'},
-            {'addr': 'nyot_element3', 'not': '!'},
-            ]})
+    _EXP_THREE_NOT_ELEMENTS)
 
 # First nesting of a simple element
+_EXP_CAT_1 = {
+    'aml_nesting': [
+        {'addr': 'cat_1'}
+    ]
+}
 assertParseElementTrue(
     aml_nesting,
     '{ cat_1; };',
-    {
-        'aml_nesting': [
-            {'addr': 'cat_1'}
-        ]
-    }
+    _EXP_CAT_1
 )
 # First not nesting of a simple element
+_EXP_NOT_CAT_1 = {
+    'aml_nesting': [
+        {'addr': 'Not_cat_1', 'not': '!'}
+    ]
+}
 assertParseElementTrue(
     aml_nesting,
     '{ ! Not_cat_1; };',
-    {
-        'aml_nesting': [
-            {'addr': 'Not_cat_1', 'not': '!'}
-        ]
-    }
+    _EXP_NOT_CAT_1
 )
 
 # First nesting of a simple element
+_EXP_VIA = {
+    'aml_nesting': [
+                {'addr': 'via_1'},
+                {'addr': 'via_2'},
+                {'addr': 'via_3'},
+    ]}
 assertParseElementTrue(
     aml_nesting,
     '{ via_1; via_2; via_3; };',
-    {
-        'aml_nesting': [
-                    {'addr': 'via_1'},
-                    {'addr': 'via_2'},
-                    {'addr': 'via_3'},
-        ]})
+    _EXP_VIA)
 
 # First nesting of a simple element
+_EXP_BOA = {
+    'aml_nesting': [
+                {'addr': 'boa_1'},
+                {'addr': 'boa_2', 'not': '!'},
+                {'addr': 'boa_3'},
+    ]}
 assertParseElementTrue(
     aml_nesting,
     '{ boa_1; ! boa_2; boa_3; };',
-    {
-        'aml_nesting': [
-                    {'addr': 'boa_1'},
-                    {'addr': 'boa_2', 'not': '!'},
-                    {'addr': 'boa_3'},
-        ]}
+    _EXP_BOA
 )
 
 # Simplest ACL statement
+_EXP_ACL_NULL = {'acl_name': 'null', 'aml_series': [[]]}
 assertParseElementTrue(
     clause_stmt_acl_standalone,
         'acl null { };',
-        {'acl_name': 'null', 'aml_series': [[]]}
+        _EXP_ACL_NULL
     )
+# 'acl' keyword must not be glued onto the ACL name
+assertParseElementFalse(
+    clause_stmt_acl_standalone,
+    'aclnull { };',
+    _EXP_ACL_NULL
+)
 test_data = 'acl simplest { statement; };'
-expected_result = {
+_EXP_SIMPLEST = {
     'acl_name': 'simplest',
     'aml_series': [
         {
@@ -315,119 +417,124 @@ expected_result = {
                 ]}
         ]}
 
-assertParseElementTrue(clause_stmt_acl_standalone, test_data, expected_result)
-expected_result = {'acls': [expected_result]}  # add the series and retest
-assertParseElementTrue(clause_stmt_acl_series, test_data, expected_result)
+assertParseElementTrue(clause_stmt_acl_standalone, test_data, _EXP_SIMPLEST)
+_EXP_SIMPLEST_SERIES = {'acls': [_EXP_SIMPLEST]}  # add the series and retest
+assertParseElementTrue(clause_stmt_acl_series, test_data, _EXP_SIMPLEST_SERIES)
 
 # A simple statement using an exclamation ('!')
+_EXP_SIMPLEST_STATEMENT = {
+    'acls': [
+        {
+            'acl_name': 'simplest_statement',
+            'aml_series': [
+                {
+                    'aml_nesting': [
+                        {'addr': 'simple_statement_w_exclamation', 'not': '!'}
+                        ]}
+                ]}
+        ]}
 assertParseElementTrue(
-    clause_stmt_acl_series.setDebug(True),
+    clause_stmt_acl_series,
     'acl simplest_statement { ! simple_statement_w_exclamation; };',
-    {
-        'acls': [
-            {
-                'acl_name': 'simplest_statement',
-                'aml_series': [
-                    {
-                        'aml_nesting': [
-                            {'addr': 'simple_statement_w_exclamation', 'not': '!'}
-                            ]}
-                    ]}
-            ]}
+    _EXP_SIMPLEST_STATEMENT
 )
 
 # A simple series of address elements
+_EXP_SINGLE_STATEMENT = {
+    'acl_name': 'single_statement',
+    'aml_series': [
+        {
+            'aml_nesting': [
+                {'addr': 'series'},
+                {'addr': 'of'},
+                {'addr': 'elements'},
+                ]}
+        ]}
 assertParseElementTrue(
     clause_stmt_acl_standalone,
     'acl single_statement { series; of; elements; };',
-    {
-        'acl_name': 'single_statement',
-        'aml_series': [
-            {
-                'aml_nesting': [
-                    {'addr': 'series'},
-                    {'addr': 'of'},
-                    {'addr': 'elements'},
-                    ]}
-            ]}
+    _EXP_SINGLE_STATEMENT
 )
 
 # A simple series of three ACL statements
+_EXP_THREE_STATEMENTS = {
+    'acls': [
+        {
+            'acl_name': 'first_statement',
+            'aml_series': [
+                {
+                    'aml_nesting': [
+                        {'addr': 'element1'}
+                        ]}
+            ]},
+        {
+            'acl_name': 'second',
+            'aml_series': [
+                {
+                    'aml_nesting': [
+                        {'addr': 'element2'}
+                        ]}
+            ]},
+        {
+            'acl_name': 'third',
+            'aml_series': [
+                {
+                    'aml_nesting': [
+                        {'addr': 'element3'}
+                    ]}
+            ]}
+    ]}
 assertParseElementTrue(
     clause_stmt_acl_series,
     'acl first_statement { element1; }; acl second { element2; }; acl third { element3; };',
-    {
-        'acls': [
-            {
-                'acl_name': 'first_statement',
-                'aml_series': [
-                    {
-                        'aml_nesting': [
-                            {'addr': 'element1'}
-                            ]}
-                ]},
-            {
-                'acl_name': 'second',
-                'aml_series': [
-                    {
-                        'aml_nesting': [
-                            {'addr': 'element2'}
-                            ]}
-                ]},
-            {
-                'acl_name': 'third',
-                'aml_series': [
-                    {
-                        'aml_nesting': [
-                            {'addr': 'element3'}
-                        ]}
-                ]}
-        ]}
+    _EXP_THREE_STATEMENTS
 )
 
+_EXP_NEW_SERIES = {
+    'acls': [
+        {
+            'acl_name': 'new_series',
+            'aml_series': [
+                {
+                    'aml_nesting': [
+                        {'addr': 'master_nameservers'},
+                        {'addr': 'slave_nameservers'}
+                    ]}
+            ]}
+    ]}
 assertParseElementTrue(
     clause_stmt_acl_series,
     'acl new_series { master_nameservers; slave_nameservers; };',
-    {
-        'acls': [
-            {
-                'acl_name': 'new_series',
-                'aml_series': [
-                    {
-                        'aml_nesting': [
-                            {'addr': 'master_nameservers'},
-                            {'addr': 'slave_nameservers'}
-                        ]}
-                ]}
-        ]}
+    _EXP_NEW_SERIES
 )
 
+_EXP_MY_ACL_NAME = {
+    'acls': [
+        {
+            'acl_name': 'my_acl_name',
+            'aml_series': [
+                {
+                    'aml_nesting': [
+                        {'addr': 'master_nameservers'},
+                        {'addr': 'slave_nameservers'},
+                    ]},
+            ]},
+        {
+            'acl_name': 'a',
+            'aml_series': [
+                {
+                    'aml_nesting': [
+                        {'addr': 'b'}
+                    ]}
+            ]}
+    ]}
 assertParseElementTrue(
     clause_stmt_acl_series,
     'acl my_acl_name { master_nameservers; slave_nameservers; }; acl a { b; };',
-    {
-        'acls': [
-            {
-                'acl_name': 'my_acl_name',
-                'aml_series': [
-                    {
-                        'aml_nesting': [
-                            {'addr': 'master_nameservers'},
-                            {'addr': 'slave_nameservers'},
-                        ]},
-                ]},
-            {
-                'acl_name': 'a',
-                'aml_series': [
-                    {
-                        'aml_nesting': [
-                            {'addr': 'b'}
-                        ]}
-                ]}
-        ]}
+    _EXP_MY_ACL_NAME
 )
 test_data = 'acl target_acl { master_nameservers; ! slave_nameservers; }; acl a { ! b; };'
-expected_result = {
+_EXP_TARGET_ACL = {
     'acls': [
         {
             'acl_name': 'target_acl',
@@ -447,85 +554,91 @@ expected_result = {
                     ]}
             ]}
     ]}
-assertParseElementTrue(clause_stmt_acl_series, test_data, expected_result)
+assertParseElementTrue(clause_stmt_acl_series, test_data, _EXP_TARGET_ACL)
 
 ######################################################3
 #  Standalone ACL statement
 #######################################################
 
+_EXP_TRANSFER_BASTIONS = {
+    'acl_name': 'transfer_bastions',
+        'aml_series': [[]]}
 assertParseElementTrue(
     clause_stmt_acl_standalone,
     'acl transfer_bastions { };',
-    {
-        'acl_name': 'transfer_bastions',
-            'aml_series': [[]]}
+    _EXP_TRANSFER_BASTIONS
 )
+_EXP_ONE_1_1_1_1 = {
+    'acl_name': 'one',
+    'aml_series': [
+        {
+            'aml_nesting': [
+                {'addr': '1.1.1.1'}
+            ]}
+    ]}
 assertParseElementTrue(
     clause_stmt_acl_standalone,
     'acl one { 1.1.1.1; };',
-    {
-        'acl_name': 'one',
-        'aml_series': [
-            {
-                'aml_nesting': [
-                    {'addr': '1.1.1.1'}
-                ]}
-        ]}
+    _EXP_ONE_1_1_1_1
 )
+_EXP_ONE_23_23_23_23 = {
+    'acl_name': 'one',
+    'aml_series': [
+        {
+            'aml_nesting': [
+                {'addr': '23.23.23.23', 'not': '!'}
+            ]}
+    ]}
 assertParseElementTrue(
     clause_stmt_acl_standalone,
     'acl one { ! 23.23.23.23; };',
-    {
-        'acl_name': 'one',
-        'aml_series': [
-            {
-                'aml_nesting': [
-                    {'addr': '23.23.23.23', 'not': '!'}
-                ]}
-        ]}
+    _EXP_ONE_23_23_23_23
 )
+_EXP_ONE_24_24_24_24 = {
+    'acl_name': 'one',
+    'aml_series': [  # '[' supports series of 'aml'
+        {  # '{' supports each elements';' within each 'aml'
+            'aml_nesting': [
+                {
+                    'addr': '24.24.24.24',
+                    'not': '!'
+                }
+            ]}
+    ]}
 assertParseElementTrue(
     clause_stmt_acl_standalone,
     'acl one { ! 24.24.24.24; };',
-    {
-        'acl_name': 'one',
-        'aml_series': [  # '[' supports series of 'aml'
-            {  # '{' supports each elements';' within each 'aml'
-                'aml_nesting': [
-                    {
-                        'addr': '24.24.24.24',
-                        'not': '!'
-                    }
-                ]}
-        ]}
+    _EXP_ONE_24_24_24_24
 )
+_EXP_ONE_8_8_8_8 = {
+    'acl_name': 'one',
+    'aml_series': [
+        {
+            'aml_nesting': [
+                {'addr': '8.8.8.8', 'not': '!'}
+            ]}
+    ]}
 assertParseElementTrue(
     clause_stmt_acl_standalone,
     'acl one { ! 8.8.8.8; };',
-    {
-        'acl_name': 'one',
-        'aml_series': [
-            {
-                'aml_nesting': [
-                    {'addr': '8.8.8.8', 'not': '!'}
-                ]}
-        ]}
+    _EXP_ONE_8_8_8_8
 )
+_EXP_AAA = {
+    'acl_name': 'aaa',
+    'aml_series': [
+        {
+            'aml_nesting': [
+                {'addr': 'bbb'}
+            ]}
+    ]}
 assertParseElementTrue(
     clause_stmt_acl_standalone,
     'acl aaa { bbb; };',
-    {
-        'acl_name': 'aaa',
-        'aml_series': [
-            {
-                'aml_nesting': [
-                    {'addr': 'bbb'}
-                ]}
-        ]}
+    _EXP_AAA
 )
 
 test_data = 'acl my_element_is_not { ! knotted_element; };'
-expected_result = {
+_EXP_MY_ELEMENT_IS_NOT = {
     'acl_name': 'my_element_is_not',
     'aml_series': [
         {
@@ -536,9 +649,9 @@ expected_result = {
                 }
             ]}
     ]}
-assertParseElementTrue(clause_stmt_acl_standalone, test_data, expected_result)
-expected_result = {'acls': [expected_result]}  # add the series and retest
-assertParseElementTrue(clause_stmt_acl_series, test_data, expected_result)
+assertParseElementTrue(clause_stmt_acl_standalone, test_data, _EXP_MY_ELEMENT_IS_NOT)
+_EXP_MY_ELEMENT_IS_NOT_SERIES = {'acls': [_EXP_MY_ELEMENT_IS_NOT]}  # add the series and retest
+assertParseElementTrue(clause_stmt_acl_series, test_data, _EXP_MY_ELEMENT_IS_NOT_SERIES)
 
 # Bug #1?: Pretty sure that aml_nesting ParserElement should have
 #          provided the Optional(exclamation) here:
@@ -556,21 +669,22 @@ assertParseElementTrue(clause_stmt_acl_series, test_data, expected_result)
 #                  ^
 # Expected "}", found '!'  (at char 17), (line:1, col:18)
 # assert(***FALSE***)
+_EXP_NESTED_AML = {
+    'acl_name': 'nested_aml',
+    'aml_series': [  # first set of curly braces
+        {
+            'aml_nesting': [  # second set of curly braces
+                {'aml_nesting': [  # second set of curly braces
+                    {'addr': 'name_5015'},
+                    {'addr': 'name_5016'}
+                ],
+                'not': '!'}
+            ]}
+    ]}
 assertParseElementTrue(
     clause_stmt_acl_standalone,
     'acl nested_aml { ! { name_5015; name_5016; }; };',
-    {
-        'acl_name': 'nested_aml',
-        'aml_series': [  # first set of curly braces
-            {
-                'aml_nesting': [  # second set of curly braces
-                    {'aml_nesting': [  # second set of curly braces
-                        {'addr': 'name_5015'},
-                        {'addr': 'name_5016'}
-                    ],
-                    'not': '!'}
-                ]}
-        ]}
+    _EXP_NESTED_AML
 )
 
 
@@ -594,7 +708,7 @@ assertParseElementTrue(
 #
 #
 test_data = 'acl nested_aml_nots { ! { ! { ! master_nameservers; }; }; };'
-expected_result = {
+_EXP_NESTED_AML_NOTS = {
     'acl_name': 'nested_aml_nots',
     'aml_series': [
         {
@@ -617,29 +731,30 @@ expected_result = {
         },
     ],
 }
-assertParseElementTrue(clause_stmt_acl_standalone, test_data, expected_result)
-expected_result = {'acls': [expected_result]}  # add the series and retest
-assertParseElementTrue(clause_stmt_acl_series, test_data, expected_result)
+assertParseElementTrue(clause_stmt_acl_standalone, test_data, _EXP_NESTED_AML_NOTS)
+_EXP_NESTED_AML_NOTS_SERIES = {'acls': [_EXP_NESTED_AML_NOTS]}  # add the series and retest
+assertParseElementTrue(clause_stmt_acl_series, test_data, _EXP_NESTED_AML_NOTS_SERIES)
 
+_EXP_A_SET = {
+    'acl_name': 'a_set',
+    'aml_series': [
+        {
+            'aml_nesting': [
+                {'addr': 'sfirst_set'},
+                {
+                    'aml_nesting': [
+                        {'addr': 'second_set'},
+                        {'addr': 'sa_third_set'},
+                    ]
+                }
+            ]
+        }
+    ]
+}
 assertParseElementTrue(
     clause_stmt_acl_standalone,
     'acl a_set { sfirst_set; { second_set; sa_third_set; }; };',
-    {
-        'acl_name': 'a_set',
-        'aml_series': [
-            {
-                'aml_nesting': [
-                    {'addr': 'sfirst_set'},
-                    {
-                        'aml_nesting': [
-                            {'addr': 'second_set'},
-                            {'addr': 'sa_third_set'},
-                        ]
-                    }
-                ]
-            }
-        ]
-    }
+    _EXP_A_SET
 
 )
 